@@ -1,10 +1,8 @@
 import random
 import subprocess
-import json
 from typing import List, Optional
 
-import requests
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from tools.nuclei import run_nuclei
 from tools.ffuf import run_ffuf
@@ -17,10 +15,11 @@ from tools.subfinder import run_subfinder
 from tools.tlsx import run_tlsx
 from tools.xsstrike import run_xsstrike
 from tools.ipinfo import run_ipinfo
-from tools.amass import amass_wrapper
-from tools.dirsearch import dirsearch_wrapper
+from tools.amass import amass_wrapper as run_amass
+from tools.dirsearch import dirsearch_wrapper as run_dirsearch
 from tools.gospider import gospider_wrapper, gospider_crawl_with_filter
-from tools.arjun import arjun_wrapper, arjun_bulk_scan, arjun_with_custom_payloads
+from tools.arjun import arjun_wrapper, arjun_bulk_scan, arjun_with_custom_payloads, arjun_sharded_scan
+from tools.json_compat import dumps
 
 # Create server
 mcp = FastMCP(name="secops-mcp",
@@ -134,12 +133,12 @@ def ipinfo_wrapper(
 
 
 @mcp.tool()
-def amass_wrapper(
+async def amass_wrapper(
     domain: str,
     passive: bool = True,
 ) -> str:
     """Wrapper for running Amass subdomain enumeration."""
-    return amass_wrapper(domain, passive)
+    return dumps(await run_amass(domain, passive))
 
 
 @mcp.tool()
@@ -149,11 +148,11 @@ def dirsearch_wrapper(
     wordlist: Optional[str] = None,
 ) -> str:
     """Wrapper for running Dirsearch directory brute forcing."""
-    return dirsearch_wrapper(url, extensions, wordlist)
+    return dumps(run_dirsearch(url, extensions, wordlist))
 
 
 @mcp.tool()
-def gospider_scan(
+async def gospider_scan(
     target: str,
     depth: int = 3,
     concurrent: int = 10,
@@ -162,10 +161,11 @@ def gospider_scan(
     headers: Optional[List[str]] = None,
     include_subs: bool = False,
     include_other_source: bool = False,
-    output_format: str = "json"
+    output_format: str = "json",
+    ctx: Context = None
 ) -> str:
     """Wrapper for running Gospider web crawling."""
-    result = gospider_wrapper(
+    result = await gospider_wrapper(
         target=target,
         depth=depth,
         concurrent=concurrent,
@@ -174,13 +174,14 @@ def gospider_scan(
         headers=headers,
         include_subs=include_subs,
         include_other_source=include_other_source,
-        output_format=output_format
+        output_format=output_format,
+        on_progress=ctx.report_progress if ctx else None
     )
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 @mcp.tool()
-def gospider_filtered_scan(
+async def gospider_filtered_scan(
     target: str,
     extensions: Optional[List[str]] = None,
     exclude_extensions: Optional[List[str]] = None,
@@ -188,10 +189,11 @@ def gospider_filtered_scan(
     depth: int = 3,
     concurrent: int = 10,
     timeout: int = 10,
-    include_subs: bool = False
+    include_subs: bool = False,
+    ctx: Context = None
 ) -> str:
     """Wrapper for running Gospider web crawling with filtering capabilities."""
-    result = gospider_crawl_with_filter(
+    result = await gospider_crawl_with_filter(
         target=target,
         extensions=extensions,
         exclude_extensions=exclude_extensions,
@@ -199,13 +201,14 @@ def gospider_filtered_scan(
         depth=depth,
         concurrent=concurrent,
         timeout=timeout,
-        include_subs=include_subs
+        include_subs=include_subs,
+        on_progress=ctx.report_progress if ctx else None
     )
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 @mcp.tool()
-def arjun_scan(
+async def arjun_scan(
     url: str,
     method: str = "GET",
     wordlist: Optional[str] = None,
@@ -218,7 +221,7 @@ def arjun_scan(
     output_format: str = "json"
 ) -> str:
     """Wrapper for running Arjun HTTP parameter discovery."""
-    result = arjun_wrapper(
+    result = await arjun_wrapper(
         url=url,
         method=method,
         wordlist=wordlist,
@@ -230,30 +233,36 @@ def arjun_scan(
         stable=stable,
         output_format=output_format
     )
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 @mcp.tool()
-def arjun_bulk_parameter_scan(
+async def arjun_bulk_parameter_scan(
     urls: List[str],
     method: str = "GET",
     wordlist: Optional[str] = None,
+    timeout: int = 10,
     threads: int = 25,
-    stable: bool = False
+    stable: bool = False,
+    max_concurrency: int = 8,
+    batch: bool = True
 ) -> str:
     """Wrapper for running Arjun parameter discovery on multiple URLs."""
-    result = arjun_bulk_scan(
+    result = await arjun_bulk_scan(
         urls=urls,
         method=method,
         wordlist=wordlist,
+        timeout=timeout,
         threads=threads,
-        stable=stable
+        stable=stable,
+        max_concurrency=max_concurrency,
+        batch=batch
     )
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 @mcp.tool()
-def arjun_custom_parameter_scan(
+async def arjun_custom_parameter_scan(
     url: str,
     method: str = "GET",
     custom_params: Optional[List[str]] = None,
@@ -263,7 +272,7 @@ def arjun_custom_parameter_scan(
     stable: bool = False
 ) -> str:
     """Wrapper for running Arjun with custom parameter testing."""
-    result = arjun_with_custom_payloads(
+    result = await arjun_with_custom_payloads(
         url=url,
         method=method,
         custom_params=custom_params,
@@ -272,7 +281,32 @@ def arjun_custom_parameter_scan(
         threads=threads,
         stable=stable
     )
-    return json.dumps(result, indent=2)
+    return dumps(result)
+
+
+@mcp.tool()
+async def arjun_sharded_parameter_scan(
+    url: str,
+    wordlist: str,
+    shards: int = 4,
+    method: str = "GET",
+    timeout: int = 10,
+    threads: int = 25,
+    stable: bool = False,
+    max_concurrency: int = 8
+) -> str:
+    """Wrapper for running Arjun with a large wordlist split across parallel processes."""
+    result = await arjun_sharded_scan(
+        url=url,
+        wordlist=wordlist,
+        shards=shards,
+        method=method,
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+        threads=threads,
+        stable=stable
+    )
+    return dumps(result)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 import subprocess
-import json
+from contextlib import aclosing
 from typing import Optional, Dict, Any
 
-def amass_wrapper(domain: str, passive: bool = True) -> Dict[str, Any]:
+from tools.json_compat import loads, JSONDecodeError
+from tools.process import stream_lines
+
+async def amass_wrapper(domain: str, passive: bool = True) -> Dict[str, Any]:
     """
     Wrapper for Amass subdomain enumeration tool.
     
@@ -20,28 +23,21 @@ def amass_wrapper(domain: str, passive: bool = True) -> Dict[str, Any]:
             cmd.append("-passive")
         cmd.extend(["-d", domain, "-json", "-"])
         
-        # Run the command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Parse the output
+        # Run the command, parsing each line as it arrives
         subdomains = []
-        for line in result.stdout.splitlines():
-            if line.strip():
-                try:
-                    data = json.loads(line)
-                    subdomains.append({
-                        "name": data.get("name"),
-                        "domain": data.get("domain"),
-                        "addresses": data.get("addresses", []),
-                        "sources": data.get("sources", [])
-                    })
-                except json.JSONDecodeError:
-                    continue
+        async with aclosing(stream_lines(cmd)) as lines:
+            async for line in lines:
+                if line.strip():
+                    try:
+                        data = loads(line)
+                        subdomains.append({
+                            "name": data.get("name"),
+                            "domain": data.get("domain"),
+                            "addresses": data.get("addresses", []),
+                            "sources": data.get("sources", [])
+                        })
+                    except JSONDecodeError:
+                        continue
         
         return {
             "success": True,
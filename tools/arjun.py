@@ -1,8 +1,66 @@
+import asyncio
+import os
+import shutil
 import subprocess
-import json
+import tempfile
+from contextlib import aclosing
 from typing import Optional, Dict, Any, List
 
-def arjun_wrapper(
+from tools.json_compat import loads, JSONDecodeError
+from tools.process import stream_lines
+
+# Resolve the binary once instead of searching PATH on every scan
+ARJUN_BIN = shutil.which("arjun") or "arjun"
+
+def _extract_parameters(data: Any) -> List[Any]:
+    """Pull the discovered parameter names out of one decoded Arjun JSON value."""
+    if isinstance(data, dict):
+        # Arjun's own JSON report uses "params"; accept "parameters" as well
+        data = data.get("params", data.get("parameters", []))
+    if isinstance(data, list):
+        # Only names are parameters; anything else would break set/sort merges
+        return [param for param in data if isinstance(param, str)]
+    if isinstance(data, str):
+        return [data]
+    return []
+
+def _arjun_options(
+    method: str = "GET",
+    wordlist: Optional[str] = None,
+    headers: Optional[List[str]] = None,
+    data: Optional[str] = None,
+    delay: int = 0,
+    timeout: int = 10,
+    threads: int = 25,
+    stable: bool = False
+) -> List[str]:
+    """Build the scan options shared by single-URL and batched Arjun runs."""
+    # Add method
+    options = ["-m", method.upper()]
+    
+    # Add options
+    if wordlist:
+        options.extend(["-w", wordlist])
+        
+    if headers:
+        for header in headers:
+            options.extend(["-H", header])
+            
+    if data:
+        options.extend(["-d", data])
+        
+    if delay > 0:
+        options.extend(["--delay", str(delay)])
+        
+    options.extend(["-t", str(timeout)])
+    options.extend(["--threads", str(threads)])
+    
+    if stable:
+        options.append("--stable")
+    
+    return options
+
+async def arjun_wrapper(
     url: str,
     method: str = "GET",
     wordlist: Optional[str] = None,
@@ -34,30 +92,17 @@ def arjun_wrapper(
     """
     try:
         # Build the command
-        cmd = ["arjun", "-u", url]
-        
-        # Add method
-        cmd.extend(["-m", method.upper()])
-        
-        # Add options
-        if wordlist:
-            cmd.extend(["-w", wordlist])
-            
-        if headers:
-            for header in headers:
-                cmd.extend(["-H", header])
-                
-        if data:
-            cmd.extend(["-d", data])
-            
-        if delay > 0:
-            cmd.extend(["--delay", str(delay)])
-            
-        cmd.extend(["-t", str(timeout)])
-        cmd.extend(["--threads", str(threads)])
-        
-        if stable:
-            cmd.append("--stable")
+        cmd = [ARJUN_BIN, "-u", url]
+        cmd.extend(_arjun_options(
+            method=method,
+            wordlist=wordlist,
+            headers=headers,
+            data=data,
+            delay=delay,
+            timeout=timeout,
+            threads=threads,
+            stable=stable
+        ))
             
         if output_format == "json":
             cmd.append("-oJ")
@@ -66,39 +111,28 @@ def arjun_wrapper(
             cmd.append("-oT")
             cmd.append("-")  # Output to stdout
         
-        # Run the command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Parse the output
+        # Run the command, parsing results as they arrive
         parameters = []
         
         if output_format == "json":
-            try:
-                # Arjun outputs each URL's results as separate JSON objects
-                for line in result.stdout.splitlines():
+            # Arjun outputs each URL's results as separate JSON objects
+            async with aclosing(stream_lines(cmd)) as lines:
+                async for line in lines:
                     if line.strip():
-                        data = json.loads(line)
-                        if "parameters" in data:
-                            parameters.extend(data["parameters"])
-                        elif isinstance(data, list):
-                            parameters.extend(data)
-                        elif isinstance(data, str):
-                            parameters.append(data)
-            except json.JSONDecodeError:
-                # Fallback to parsing as text
-                for line in result.stdout.splitlines():
-                    if line.strip() and not line.startswith("["):
-                        parameters.append(line.strip())
+                        try:
+                            data = loads(line)
+                        except JSONDecodeError:
+                            # Fallback to parsing as text
+                            if not line.startswith(b"["):
+                                parameters.append(line.strip().decode("utf-8", "replace"))
+                            continue
+                        parameters.extend(_extract_parameters(data))
         else:
             # Parse plain text output
-            for line in result.stdout.splitlines():
-                if line.strip() and not line.startswith("["):
-                    parameters.append(line.strip())
+            async with aclosing(stream_lines(cmd)) as lines:
+                async for line in lines:
+                    if line.strip() and not line.startswith(b"["):
+                        parameters.append(line.strip().decode("utf-8", "replace"))
         
         return {
             "success": True,
@@ -120,12 +154,85 @@ def arjun_wrapper(
             "error": str(e)
         }
 
-def arjun_bulk_scan(
+async def _arjun_batch_scan(
     urls: List[str],
     method: str = "GET",
     wordlist: Optional[str] = None,
+    timeout: int = 10,
     threads: int = 25,
     stable: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Scan several URLs with a single Arjun process fed through -i.
+    
+    Args:
+        urls (List[str]): List of target URLs to scan
+        method (str): HTTP method to use
+        wordlist (str): Custom wordlist file path
+        timeout (int): Request timeout in seconds
+        threads (int): Number of threads to use
+        stable (bool): Use stable mode
+        
+    Returns:
+        List[Dict[str, Any]]: Per-URL results in the same order as urls
+    
+    Raises:
+        subprocess.CalledProcessError: If Arjun exits with a non-zero status
+        ValueError: If a JSON line can't be decoded or attributed to a target URL
+    """
+    parameters = {url: [] for url in urls}
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        input_path = f.name
+        f.write("\n".join(urls))
+    
+    try:
+        # Same options as the per-URL fallback, so both runs scan alike
+        cmd = [ARJUN_BIN, "-i", input_path]
+        cmd.extend(_arjun_options(
+            method=method,
+            wordlist=wordlist,
+            timeout=timeout,
+            threads=threads,
+            stable=stable
+        ))
+        cmd.extend(["-oJ", "-"])  # Output to stdout
+        
+        # Each JSON line maps target URLs to results shaped like arjun_wrapper's.
+        # Banners and status text are skipped; JSON that can't be attributed
+        # to a URL means we misread the output, so give up on the batch.
+        async with aclosing(stream_lines(cmd)) as lines:
+            async for line in lines:
+                if line[:1] != b"{":
+                    continue
+                data = loads(line)
+                if not isinstance(data, dict) or not data.keys() <= parameters.keys():
+                    raise ValueError("Unrecognised Arjun batch output")
+                for url, found in data.items():
+                    parameters[url].extend(_extract_parameters(found))
+    finally:
+        os.unlink(input_path)
+    
+    return [
+        {
+            "success": True,
+            "target": url,
+            "method": method.upper(),
+            "parameters": parameters[url],
+            "count": len(parameters[url])
+        }
+        for url in urls
+    ]
+
+async def arjun_bulk_scan(
+    urls: List[str],
+    method: str = "GET",
+    wordlist: Optional[str] = None,
+    timeout: int = 10,
+    threads: int = 25,
+    stable: bool = False,
+    max_concurrency: int = 8,
+    batch: bool = True
 ) -> Dict[str, Any]:
     """
     Enhanced Arjun wrapper for scanning multiple URLs.
@@ -134,25 +241,62 @@ def arjun_bulk_scan(
         urls (List[str]): List of target URLs to scan
         method (str): HTTP method to use
         wordlist (str): Custom wordlist file path
+        timeout (int): Request timeout in seconds
         threads (int): Number of threads to use
         stable (bool): Use stable mode
+        max_concurrency (int): Maximum number of Arjun processes to run at once
+            when scanning per URL (batch=False, or after a failed batch)
+        batch (bool): Scan all URLs with one Arjun process instead of one per URL,
+            falling back to per-URL scans if the batched run fails
         
     Returns:
-        Dict[str, Any]: Aggregated results from all scanned URLs
+        Dict[str, Any]: Aggregated results from all scanned URLs, with "batched"
+            telling whether one batched run produced them and "batch_error"
+            explaining why it fell back to per-URL scans
     """
     all_results = {}
     successful_scans = 0
     failed_scans = 0
     
-    for url in urls:
-        result = arjun_wrapper(
-            url=url,
-            method=method,
-            wordlist=wordlist,
-            threads=threads,
-            stable=stable
-        )
+    results = None
+    batch_error = None
+    if not urls:
+        results = []
+    elif batch:
+        # One process for every target pays Arjun's startup cost only once.
+        # If it fails, rescan per URL so one bad target can't fail them all.
+        try:
+            results = await _arjun_batch_scan(
+                urls,
+                method=method,
+                wordlist=wordlist,
+                timeout=timeout,
+                threads=threads,
+                stable=stable
+            )
+        except Exception as e:
+            batch_error = str(e)
+    
+    batched = batch and batch_error is None
+    if results is None:
+        # Cap concurrent arjun processes so we don't exhaust file descriptors
+        # or multiply arjun's own --threads too far.
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
         
+        async def scan(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await arjun_wrapper(
+                    url=url,
+                    method=method,
+                    wordlist=wordlist,
+                    timeout=timeout,
+                    threads=threads,
+                    stable=stable
+                )
+        
+        results = await asyncio.gather(*(scan(url) for url in urls))
+    
+    for url, result in zip(urls, results):
         if result["success"]:
             all_results[url] = {
                 "parameters": result["parameters"],
@@ -167,16 +311,22 @@ def arjun_bulk_scan(
             }
             failed_scans += 1
     
-    return {
+    summary = {
         "success": True,
         "method": method.upper(),
         "total_urls": len(urls),
         "successful_scans": successful_scans,
         "failed_scans": failed_scans,
+        "batched": batched,
         "results": all_results
     }
+    
+    if batch_error:
+        summary["batch_error"] = batch_error
+    
+    return summary
 
-def arjun_with_custom_payloads(
+async def arjun_with_custom_payloads(
     url: str,
     method: str = "GET",
     custom_params: Optional[List[str]] = None,
@@ -197,21 +347,103 @@ def arjun_with_custom_payloads(
         Dict[str, Any]: Results with custom parameter testing
     """
     # Get base results
-    results = arjun_wrapper(url, method, wordlist, **kwargs)
+    results = await arjun_wrapper(url, method, wordlist, **kwargs)
     
     if not results["success"]:
         return results
     
     # Test custom parameters if provided
     if custom_params:
-        custom_found = []
-        for param in custom_params:
-            # Simple test by checking if parameter is in discovered list
-            if param in results["parameters"]:
-                custom_found.append(param)
+        # Simple test by checking if parameter is in discovered list
+        discovered = set(results["parameters"])
+        custom_found = [param for param in custom_params if param in discovered]
         
         results["custom_parameters_tested"] = custom_params
         results["custom_parameters_found"] = custom_found
         results["custom_match_count"] = len(custom_found)
     
     return results
+
+async def arjun_sharded_scan(
+    url: str,
+    wordlist: str,
+    shards: int = 4,
+    method: str = "GET",
+    max_concurrency: int = 8,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Arjun wrapper that splits a large wordlist across parallel Arjun processes.
+    
+    Args:
+        url (str): Target URL to scan
+        wordlist (str): Wordlist file path to split into shards
+        shards (int): Number of shards to split the wordlist into
+        method (str): HTTP method to use
+        max_concurrency (int): Maximum number of Arjun processes to run at once
+        **kwargs: Additional arguments passed to arjun_wrapper
+        
+    Returns:
+        Dict[str, Any]: Merged parameters discovered by all shards
+    """
+    try:
+        with open(wordlist) as f:
+            words = [word for word in f.read().splitlines() if word.strip()]
+    except OSError as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+    
+    if not words:
+        return {
+            "success": False,
+            "error": f"Wordlist {wordlist} contains no parameters"
+        }
+    
+    # Every shard gets an interleaved slice so they finish at roughly the same
+    # time; never make more shards than there are words to put in them
+    shards = max(1, min(shards, len(words)))
+    shard_paths = []
+    try:
+        for i in range(shards):
+            with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+                shard_paths.append(f.name)
+                f.write("\n".join(words[i::shards]))
+    except OSError as e:
+        for shard_path in shard_paths:
+            os.unlink(shard_path)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+    
+    # Each shard is its own arjun process; cap how many run at once as
+    # arjun_bulk_scan does, and let the rest wait their turn
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def scan(shard_path: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await arjun_wrapper(url, method, shard_path, **kwargs)
+    
+    try:
+        results = await asyncio.gather(*(scan(shard_path) for shard_path in shard_paths))
+    finally:
+        for shard_path in shard_paths:
+            os.unlink(shard_path)
+    
+    succeeded = [result for result in results if result["success"]]
+    if not succeeded:
+        return results[0]
+    
+    parameters = sorted(set().union(*(result["parameters"] for result in succeeded)))
+    
+    return {
+        "success": True,
+        "target": url,
+        "method": method.upper(),
+        "parameters": parameters,
+        "count": len(parameters),
+        "shards": shards,
+        "failed_shards": len(results) - len(succeeded)
+    }
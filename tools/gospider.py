@@ -1,8 +1,32 @@
+import shutil
 import subprocess
-import json
-from typing import Optional, Dict, Any, List
+from contextlib import aclosing
+from itertools import chain
+from typing import Optional, Dict, Any, List, AsyncIterator, Awaitable, Callable
 
-def gospider_wrapper(
+import msgspec
+
+from tools.process import stream_lines
+
+# Resolve the binary once instead of searching PATH on every scan
+GOSPIDER_BIN = shutil.which("gospider") or "gospider"
+
+# Number of records between progress callbacks from gospider_wrapper
+PROGRESS_INTERVAL = 100
+
+class GospiderRecord(msgspec.Struct):
+    """A single record from Gospider's --json output."""
+    type: str = ""
+    output: Optional[str] = None
+    # Side fields are passed through untyped so an odd value can't drop the record
+    source: Any = None
+    tag: Any = None
+    status_code: Any = None
+
+# Decoding straight into GospiderRecord skips building an intermediate dict
+_record_decoder = msgspec.json.Decoder(GospiderRecord)
+
+async def gospider_stream(
     target: str, 
     depth: int = 3, 
     concurrent: int = 10,
@@ -12,6 +36,84 @@ def gospider_wrapper(
     include_subs: bool = False,
     include_other_source: bool = False,
     output_format: str = "json"
+) -> AsyncIterator[GospiderRecord]:
+    """
+    Run Gospider and yield each record as soon as it is parsed.
+    
+    Args:
+        target (str): Target URL or domain to crawl
+        depth (int): Maximum crawling depth (default: 3)
+        concurrent (int): Number of concurrent requests (default: 10)
+        timeout (int): Request timeout in seconds (default: 10)
+        user_agent (str): Custom User-Agent string
+        headers (List[str]): Custom headers to include
+        include_subs (bool): Include subdomains in crawling
+        include_other_source (bool): Include other sources like robots.txt, sitemap.xml
+        output_format (str): Output format (json, txt)
+    
+    Yields:
+        GospiderRecord: Each URL, form or secret record reported by Gospider
+    
+    Raises:
+        subprocess.CalledProcessError: If Gospider exits with a non-zero status
+    """
+    # Build the command
+    header_args = chain.from_iterable(("-H", header) for header in headers or ())
+    cmd = [
+        GOSPIDER_BIN, "-s", target,
+        "-d", str(depth),
+        "-c", str(concurrent),
+        "-t", str(timeout),
+        *header_args
+    ]
+    
+    # Add options
+    if user_agent:
+        cmd.extend(["-u", user_agent])
+        
+    if include_subs:
+        cmd.append("--subs")
+        
+    if include_other_source:
+        cmd.append("--other-source")
+        
+    if output_format == "json":
+        cmd.append("--json")
+    
+    if output_format == "json":
+        async with aclosing(stream_lines(cmd)) as lines:
+            async for line in lines:
+                # Skip banners and progress text without paying for a failed parse
+                if line[:1] != b"{":
+                    continue
+                try:
+                    record = _record_decoder.decode(line)
+                except msgspec.DecodeError:
+                    continue
+                yield record
+    else:
+        # Parse plain text output
+        async with aclosing(stream_lines(cmd)) as lines:
+            async for line in lines:
+                if line.strip() and line.startswith(b"http"):
+                    yield GospiderRecord(
+                        type="url",
+                        output=line.strip().decode("utf-8", "replace"),
+                        source="crawl",
+                        tag="url"
+                    )
+
+async def gospider_wrapper(
+    target: str, 
+    depth: int = 3, 
+    concurrent: int = 10,
+    timeout: int = 10,
+    user_agent: Optional[str] = None,
+    headers: Optional[List[str]] = None,
+    include_subs: bool = False,
+    include_other_source: bool = False,
+    output_format: str = "json",
+    on_progress: Optional[Callable[[int], Awaitable[None]]] = None
 ) -> Dict[str, Any]:
     """
     Wrapper for Gospider web crawling tool.
@@ -26,86 +128,57 @@ def gospider_wrapper(
         include_subs (bool): Include subdomains in crawling
         include_other_source (bool): Include other sources like robots.txt, sitemap.xml
         output_format (str): Output format (json, txt)
+        on_progress (Callable): Awaited with the running record count while crawling
     
     Returns:
         Dict[str, Any]: Results containing discovered URLs and related information
     """
     try:
-        # Build the command
-        cmd = ["gospider", "-s", target]
-        
-        # Add options
-        cmd.extend(["-d", str(depth)])
-        cmd.extend(["-c", str(concurrent)])
-        cmd.extend(["-t", str(timeout)])
-        
-        if user_agent:
-            cmd.extend(["-u", user_agent])
-            
-        if headers:
-            for header in headers:
-                cmd.extend(["-H", header])
-                
-        if include_subs:
-            cmd.append("--subs")
-            
-        if include_other_source:
-            cmd.append("--other-source")
-            
-        if output_format == "json":
-            cmd.append("--json")
-        
-        # Run the command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Parse the output
-        urls = []
+        # Gospider reports the same URL once per place it was found; keep the first
+        url_map = {}
         forms = []
         secrets = []
+        seen = 0
         
-        if output_format == "json":
-            for line in result.stdout.splitlines():
-                if line.strip():
-                    try:
-                        data = json.loads(line)
-                        
-                        if data.get("type") == "url":
-                            urls.append({
-                                "url": data.get("output"),
-                                "source": data.get("source"),
-                                "tag": data.get("tag"),
-                                "status": data.get("status_code")
-                            })
-                        elif data.get("type") == "form":
-                            forms.append({
-                                "url": data.get("output"),
-                                "source": data.get("source"),
-                                "tag": data.get("tag")
-                            })
-                        elif data.get("type") == "secret":
-                            secrets.append({
-                                "secret": data.get("output"),
-                                "source": data.get("source"),
-                                "tag": data.get("tag")
-                            })
-                            
-                    except json.JSONDecodeError:
-                        continue
-        else:
-            # Parse plain text output
-            for line in result.stdout.splitlines():
-                if line.strip() and line.startswith("http"):
-                    urls.append({
-                        "url": line.strip(),
-                        "source": "crawl",
-                        "tag": "url",
-                        "status": None
+        # aclosing kills the crawler immediately if we bail out mid-stream
+        async with aclosing(gospider_stream(
+            target,
+            depth=depth,
+            concurrent=concurrent,
+            timeout=timeout,
+            user_agent=user_agent,
+            headers=headers,
+            include_subs=include_subs,
+            include_other_source=include_other_source,
+            output_format=output_format
+        )) as records:
+            async for record in records:
+                if record.type == "url":
+                    if record.output not in url_map:
+                        url_map[record.output] = {
+                            "url": record.output,
+                            "source": record.source,
+                            "tag": record.tag,
+                            "status": record.status_code
+                        }
+                elif record.type == "form":
+                    forms.append({
+                        "url": record.output,
+                        "source": record.source,
+                        "tag": record.tag
+                    })
+                elif record.type == "secret":
+                    secrets.append({
+                        "secret": record.output,
+                        "source": record.source,
+                        "tag": record.tag
                     })
+                
+                seen += 1
+                if on_progress and seen % PROGRESS_INTERVAL == 0:
+                    await on_progress(seen)
+        
+        urls = list(url_map.values())
         
         return {
             "success": True,
@@ -132,7 +205,7 @@ def gospider_wrapper(
             "error": str(e)
         }
 
-def gospider_crawl_with_filter(
+async def gospider_crawl_with_filter(
     target: str,
     extensions: Optional[List[str]] = None,
     exclude_extensions: Optional[List[str]] = None,
@@ -153,7 +226,7 @@ def gospider_crawl_with_filter(
         Dict[str, Any]: Filtered crawling results
     """
     # Get base results
-    results = gospider_wrapper(target, **kwargs)
+    results = await gospider_wrapper(target, **kwargs)
     
     if not results["success"]:
         return results
@@ -162,15 +235,17 @@ def gospider_crawl_with_filter(
     filtered_urls = results["urls"]
     
     if extensions:
+        suffixes = tuple(f".{ext}" for ext in extensions)
         filtered_urls = [
             url for url in filtered_urls 
-            if any(url["url"].endswith(f".{ext}") for ext in extensions)
+            if url["url"].endswith(suffixes)
         ]
     
     if exclude_extensions:
+        excluded_suffixes = tuple(f".{ext}" for ext in exclude_extensions)
         filtered_urls = [
             url for url in filtered_urls 
-            if not any(url["url"].endswith(f".{ext}") for ext in exclude_extensions)
+            if not url["url"].endswith(excluded_suffixes)
         ]
     
     # Update results with filtered data
@@ -0,0 +1,21 @@
+import atexit
+
+import httpx
+
+# Process-wide HTTP client shared by the tools that talk to web APIs directly.
+# Reusing it keeps connections (and their TLS sessions) alive between calls.
+# Pool and HTTP/2 settings live on the transport, which the client defers to.
+HTTP = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=1,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30
+        )
+    ),
+    timeout=httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0)
+)
+
+atexit.register(HTTP.close)
@@ -1,8 +1,16 @@
+import os
 import subprocess
-import requests
 import json
 from typing import Optional
 
+from tools.http_client import HTTP
+
+IPINFO_BASE_URL = "https://ipinfo.io"
+
+# Read the optional API token once rather than on every lookup
+IPINFO_TOKEN = os.environ.get("IPINFO_TOKEN", "")
+IPINFO_HEADERS = {"Authorization": f"Bearer {IPINFO_TOKEN}"} if IPINFO_TOKEN else None
+
 
 def run_ipinfo(ip: Optional[str] = None) -> str:
     """Get IP information using ipinfo.io
@@ -13,15 +21,13 @@ def run_ipinfo(ip: Optional[str] = None) -> str:
     Returns:
         str: IP information in JSON format
     """
-    print(f"[debug] run_ipinfo(ip={ip})")
-    
     try:
         if ip:
-            url = f"https://ipinfo.io/{ip}/json"
+            url = f"{IPINFO_BASE_URL}/{ip}/json"
         else:
-            url = "https://ipinfo.io/json"
+            url = f"{IPINFO_BASE_URL}/json"
             
-        response = requests.get(url)
+        response = HTTP.get(url, headers=IPINFO_HEADERS)
         if response.status_code == 200:
             return json.dumps(response.json(), indent=2)
         else:
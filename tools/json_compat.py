@@ -0,0 +1,22 @@
+# JSON helpers that use orjson when it is installed and fall back to the stdlib.
+
+try:
+    import orjson as _json
+    
+    def loads(data):
+        # orjson accepts bytes directly, so binary pipe output needs no decode
+        return _json.loads(data)
+    
+    def dumps(obj) -> str:
+        return _json.dumps(obj).decode()
+    
+    JSONDecodeError = _json.JSONDecodeError
+except ImportError:
+    import json as _json
+    
+    loads = _json.loads
+    
+    def dumps(obj) -> str:
+        return _json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    
+    JSONDecodeError = _json.JSONDecodeError
@@ -0,0 +1,68 @@
+import asyncio
+import subprocess
+from typing import AsyncIterator, List
+
+
+async def stream_lines(cmd: List[str], limit: int = 1 << 20) -> AsyncIterator[bytes]:
+    """
+    Run a command and yield its stdout line by line as it is produced.
+    
+    Lines longer than limit are discarded whole rather than aborting the
+    stream, so one oversized record can't cost the rest of a scan's output.
+    
+    Args:
+        cmd (List[str]): Command and arguments to execute
+        limit (int): Maximum length of a single output line in bytes
+    
+    Yields:
+        bytes: Each raw line of stdout, including the trailing newline
+            (the final line may lack one)
+    
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=limit
+    )
+    
+    # Drain stderr alongside stdout so a chatty child can't block on a full pipe
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    try:
+        skipping = False
+        while True:
+            try:
+                line = await proc.stdout.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                # EOF; hand over a final unterminated line, if any
+                if e.partial and not skipping:
+                    yield e.partial
+                break
+            except asyncio.LimitOverrunError as e:
+                # Drop what's buffered and keep dropping up to the next newline
+                await proc.stdout.readexactly(e.consumed)
+                skipping = True
+                continue
+            
+            if skipping:
+                # This is the tail of the oversized line
+                skipping = False
+                continue
+            yield line
+        stderr = await stderr_task
+        returncode = await proc.wait()
+    finally:
+        # Don't leave the child running if the caller stopped early or was cancelled
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        stderr_task.cancel()
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode,
+            cmd,
+            stderr=stderr.decode("utf-8", "replace")
+        )